@@ -11,7 +11,7 @@ To create a new generator, follow these steps:
 1. Create a new Python module within the `generators` package.
 2. In the new module, define your generator class and make sure it inherits
     from `PseudoRandomNumberGenerator`.
-3. Add `__all__ = ["YourGeneratorClass"]` for your class to be visible.
+3. Import your class here and add it to `__all__` for it to be visible.
 
 Please note that the pseudorandom number generators
 in this package are intended for educational and illustrative purposes.
@@ -21,16 +21,8 @@ standard library.
 """
 
 
-import os
-import importlib
+from .lcg import LinearCongruentialGenerator
+from .mt import MersenneTwister
+from .xorshift import XORShift
 
-directory = os.path.dirname(__file__)
-
-__all__ = []
-
-for module_file in os.listdir(directory):
-    if module_file.endswith(".py") and module_file != "__init__.py":
-        module_name = module_file[:-3]
-        module_path = ".".join([__name__, module_name])
-        module = importlib.import_module(module_path)
-        __all__.append(getattr(module, module.__all__[0]))
+__all__ = [LinearCongruentialGenerator, MersenneTwister, XORShift]
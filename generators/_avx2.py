@@ -0,0 +1,63 @@
+"""
+ctypes bindings for the AVX2 kernels in `_prng_avx2.c`.
+
+Importing this module raises ImportError if the shared library is not
+built next to this file or the CPU does not support AVX2.
+"""
+
+import ctypes
+from pathlib import Path
+
+import numpy as np
+
+try:
+    _lib = ctypes.CDLL(str(Path(__file__).with_name("_prng_avx2.so")))
+except OSError as error:
+    raise ImportError("AVX2 kernels are not built") from error
+
+if not _lib.prng_has_avx2():
+    raise ImportError("CPU does not support AVX2")
+
+_uint32_array = np.ctypeslib.ndpointer(dtype=np.uint32, flags="C_CONTIGUOUS")
+
+_lib.fill_xorshift_avx2.argtypes = [
+    _uint32_array,
+    _uint32_array,
+    ctypes.c_size_t,
+]
+_lib.fill_xorshift_avx2.restype = None
+
+_lib.fill_lcg_avx2.argtypes = [
+    ctypes.c_uint32,
+    ctypes.c_uint32,
+    ctypes.c_uint32,
+    _uint32_array,
+    ctypes.c_size_t,
+]
+_lib.fill_lcg_avx2.restype = ctypes.c_uint32
+
+# Number of 32-bit states in one AVX2 register
+LANES = 8
+
+
+def fill_xorshift(state: np.ndarray, rows: int) -> np.ndarray:
+    """
+    Advance the eight uint32 XORShift32 lanes of `state`
+    by `rows` steps in place.
+
+    Return a (rows, 8) array of states, one row per step.
+    """
+    out = np.empty((rows, LANES), dtype=np.uint32)
+    _lib.fill_xorshift_avx2(state, out, rows)
+    return out
+
+
+def fill_lcg(a: int, c: int, seed: int, n: int) -> tuple[int, np.ndarray]:
+    """
+    Run the LCG `state = (a * state + c) % 2**32` `n` times from `seed`.
+
+    Return the last state and an array of the `n` generated states.
+    """
+    out = np.empty(n, dtype=np.uint32)
+    seed = _lib.fill_lcg_avx2(a, c, seed, out, n)
+    return seed, out
@@ -0,0 +1,34 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython kernel for the Linear Congruential Generator.
+
+Importing this module raises ImportError unless it is built, in which case
+`LinearCongruentialGenerator` falls back to its NumPy implementation.
+"""
+
+import numpy as np
+
+from libc.stdint cimport uint32_t
+
+
+cdef inline uint32_t _next(uint32_t *state, uint32_t a, uint32_t c) noexcept nogil:
+    # Unsigned 32-bit arithmetic wraps around modulo 2**32
+    state[0] = a * state[0] + c
+    return state[0]
+
+
+def fill_lcg(uint32_t a, uint32_t c, uint32_t seed, Py_ssize_t n):
+    """
+    Run the LCG `state = (a * state + c) % 2**32` `n` times from `seed`.
+
+    Return the last state and an array of the `n` generated states.
+    """
+    out = np.empty(n, dtype=np.uint32)
+    cdef uint32_t[::1] states = out
+    cdef Py_ssize_t i
+
+    with nogil:
+        for i in range(n):
+            states[i] = _next(&seed, a, c)
+
+    return seed, out
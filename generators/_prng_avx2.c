@@ -0,0 +1,75 @@
+/*
+ * AVX2 kernels for the XORShift and LCG generators.
+ *
+ * Both kernels step eight 32-bit states packed into one __m256i and write
+ * raw states, scaling to [0, 1) is left to the caller. Build with:
+ *
+ *     cc -O3 -shared -fPIC -o generators/_prng_avx2.so generators/_prng_avx2.c
+ */
+
+#include <immintrin.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#define LANES 8
+
+int prng_has_avx2(void)
+{
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2");
+}
+
+/*
+ * Advance the eight XORShift32 lanes of `state` by `rows` steps in place,
+ * writing the lanes after every step as one row of `out`.
+ */
+__attribute__((target("avx2")))
+void fill_xorshift_avx2(uint32_t *state, uint32_t *out, size_t rows)
+{
+    __m256i s = _mm256_loadu_si256((const __m256i *)state);
+
+    for (size_t row = 0; row < rows; row++) {
+        s = _mm256_xor_si256(s, _mm256_slli_epi32(s, 13));
+        s = _mm256_xor_si256(s, _mm256_srli_epi32(s, 17));
+        s = _mm256_xor_si256(s, _mm256_slli_epi32(s, 5));
+        _mm256_storeu_si256((__m256i *)(out + LANES * row), s);
+    }
+
+    _mm256_storeu_si256((__m256i *)state, s);
+}
+
+/*
+ * Write the next `n` states of the LCG `state = a * state + c (mod 2^32)`
+ * following `seed` to `out` and return the last one.
+ */
+__attribute__((target("avx2")))
+uint32_t fill_lcg_avx2(uint32_t a, uint32_t c, uint32_t seed,
+                       uint32_t *out, size_t n)
+{
+    uint32_t lanes[LANES];
+    uint32_t a_k = 1, c_k = 0;
+    size_t i = 0;
+
+    /* The next eight states and the constants moving a state eight ahead */
+    for (int k = 0; k < LANES; k++) {
+        a_k *= a;
+        c_k = a * c_k + c;
+        lanes[k] = a_k * seed + c_k;
+    }
+
+    __m256i s = _mm256_loadu_si256((const __m256i *)lanes);
+    const __m256i jump_a = _mm256_set1_epi32((int)a_k);
+    const __m256i jump_c = _mm256_set1_epi32((int)c_k);
+
+    for (; i + LANES <= n; i += LANES) {
+        _mm256_storeu_si256((__m256i *)(out + i), s);
+        s = _mm256_add_epi32(_mm256_mullo_epi32(s, jump_a), jump_c);
+    }
+
+    _mm256_storeu_si256((__m256i *)lanes, s);
+    for (int k = 0; i < n; i++, k++) {
+        out[i] = lanes[k];
+    }
+
+    return n ? out[n - 1] : seed;
+}
@@ -0,0 +1,29 @@
+"""
+Numba kernel for the XORShift32 generator.
+
+Importing this module raises ImportError if Numba is not installed,
+in which case `XORShift` falls back to its NumPy implementation.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def fill(state, rows):
+    """
+    Advance every lane of `state` by `rows` XORShift32 steps in place.
+
+    Return a (rows, lanes) array of states, one row per step.
+    """
+    lanes = state.shape[0]
+    out = np.empty((rows, lanes), dtype=np.uint32)
+    for row in range(rows):
+        for lane in range(lanes):
+            s = np.int64(state[lane])
+            s ^= (s << 13) & 0xFFFFFFFF
+            s ^= s >> 17
+            s ^= (s << 5) & 0xFFFFFFFF
+            state[lane] = s
+            out[row, lane] = s
+    return out
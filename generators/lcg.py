@@ -1,45 +1,146 @@
 from typing import Sequence
+
+import numpy as np
+
 from pseudorandom import PseudoRandomNumberGenerator
 
+try:
+    from generators._avx2 import fill_lcg as _fill_kernel
+except ImportError:  # AVX2 kernels are not built or not supported
+    try:
+        from generators._lcg_fast import fill_lcg as _fill_kernel
+    except ImportError:  # Cython kernel is not built
+        _fill_kernel = None
+
 
 __all__ = ["LinearCongruentialGenerator"]
 
 
+def _jump_constants(a: int, c: int, m: int, lanes: int):
+    """
+    Return multipliers and increments that move a state 1..lanes steps ahead.
+
+    For k steps ahead `state_k = (A_k * state + C_k) % m`, where
+    `A_k = a^k % m` and `C_k = c * (a^(k-1) + ... + 1) % m`.
+    """
+    multipliers = np.empty(lanes, dtype=np.uint32)
+    increments = np.empty(lanes, dtype=np.uint32)
+
+    a_k, c_k = 1, 0
+    for k in range(lanes):
+        a_k = (a * a_k) % m
+        c_k = (a * c_k + c) % m
+        multipliers[k] = a_k
+        increments[k] = c_k
+
+    return multipliers, increments
+
+
 class LinearCongruentialGenerator(PseudoRandomNumberGenerator):
     _A = 1664525
     _C = 1013904223
     _M = 2**32
 
+    # Number of states stepped in parallel by `_fill`
+    _LANES = 1024
+    # Amount of numbers generated per buffer refill
+    _BUFFER_SIZE = 16384
+
+    _LANE_A, _LANE_C = _jump_constants(_A, _C, _M, _LANES)
+
     def __init__(self):
         self._seed = None
-        self._generator = None
+        self._buffer = []
+        self._index = 0
 
     def seed(self, seed_value: int):
-        self._seed = seed_value
-        self._generator = self.random()
+        # uint32 arithmetic wraps around modulo _M by itself
+        self._seed = np.uint32(seed_value % self._M)
+        self._buffer = []
+        self._index = 0
+
+    def _fill(self, n: int) -> np.ndarray:
+        """
+        Generate the next `n` numbers of the sequence at once.
+
+        The first row of lanes holds the next `_LANES` states, every
+        following row is the previous one moved `_LANES` steps ahead,
+        so the flattened rows are exactly the sequential LCG stream.
+        """
+        if _fill_kernel is not None:
+            seed, numbers = _fill_kernel(self._A, self._C, self._seed, n)
+            self._seed = np.uint32(seed)
+            return numbers / self._M
+
+        rows = -(-n // self._LANES)
+        jump_a, jump_c = self._LANE_A[-1], self._LANE_C[-1]
+
+        states = np.empty((rows, self._LANES), dtype=np.uint32)
+        np.multiply(self._LANE_A, self._seed, out=states[0])
+        states[0] += self._LANE_C
+
+        for row in range(1, rows):
+            np.multiply(states[row - 1], jump_a, out=states[row])
+            states[row] += jump_c
+
+        numbers = states.ravel()[:n]
+        self._seed = numbers[-1]
+        return numbers / self._M
+
+    def _next(self) -> float:
+        if self._index == len(self._buffer):
+            self._buffer = self._fill(self._BUFFER_SIZE).tolist()
+            self._index = 0
+
+        number = self._buffer[self._index]
+        self._index += 1
+        return number
+
+    def random(self) -> "LinearCongruentialGenerator":
+        if self._seed is None:
+            raise ValueError("No seed provided")
+
+        return self
 
-    def _lcg(self):
-        self._seed = (self._A * self._seed + self._C) % self._M
-        return self._seed / self._M
+    def __iter__(self) -> "LinearCongruentialGenerator":
+        return self
 
-    def random(self):
+    def __next__(self) -> float:
         if self._seed is None:
             raise ValueError("No seed provided")
 
-        while True:
-            yield self._lcg()
+        return self._next()
 
     def uniform(self, low: float = 0.0, high: float = 1.0):
-        if self._generator is None:
+        if self._seed is None:
+            raise ValueError("No generator available")
+
+        return low + (high - low) * self._next()
+
+    def random_array(self, n: int) -> np.ndarray:
+        if self._seed is None:
             raise ValueError("No generator available")
 
-        return low + (high - low) * next(self._generator)
+        numbers = np.empty(n, dtype=np.float64)
+        buffered = self._buffer[self._index : self._index + n]
+        numbers[: len(buffered)] = buffered
+        self._index += len(buffered)
+
+        remaining = n - len(buffered)
+        if remaining:
+            # Fill whole rows of lanes, keeping the surplus for later calls
+            filled = self._fill(-(-remaining // self._LANES) * self._LANES)
+            numbers[len(buffered) :] = filled[:remaining]
+            self._buffer = filled[remaining:].tolist()
+            self._index = 0
+
+        return numbers
 
     def randint(self, low: int, high: int):
-        if self._generator is None:
+        if self._seed is None:
             raise ValueError("No generator available")
 
-        return int(low + (high - low + 1) * next(self._generator))
+        return int(low + (high - low + 1) * self._next())
 
     def choice(self, seq: Sequence):
         if len(seq) == 0:
@@ -49,6 +150,12 @@ class LinearCongruentialGenerator(PseudoRandomNumberGenerator):
         return seq[index]
 
     def shuffle(self, seq: Sequence):
-        for i in range(len(seq) - 1, 0, -1):
-            j = self.randint(0, i)
+        n = len(seq)
+        if n < 2:
+            return
+
+        # Swap positions for i = n - 1, ..., 1, same as randint(0, i)
+        positions = self.random_array(n - 1) * np.arange(n, 1, -1)
+        positions = positions.astype(np.int64).tolist()
+        for i, j in zip(range(n - 1, 0, -1), positions):
             seq[i], seq[j] = seq[j], seq[i]
@@ -10,12 +10,18 @@ __all__ = ["MersenneTwister"]
 class MersenneTwister(PseudoRandomNumberGenerator):
     def __init__(self):
         self._seed = None
+        self._rng = None
+        self._rand = None
+        self._randrange = None
         self._generator = None
 
     def seed(self, seed_value: int):
         self._seed = seed_value
 
-        random.seed(self._seed)
+        self._rng = random.Random(self._seed)
+        # Bound once, so calls skip the attribute lookups
+        self._rand = self._rng.random
+        self._randrange = self._rng.randrange
         self._generator = self.random()
 
     def random(self) -> Generator[int, None, None]:
@@ -23,19 +29,19 @@ class MersenneTwister(PseudoRandomNumberGenerator):
             raise ValueError("No seed is provided")
 
         while True:
-            yield random.randint(0, 2**32 - 1)
+            yield self._rng.getrandbits(32)
 
     def uniform(self, low: float = 0.0, high: float = 1.0) -> float:
         if self._generator is None:
             raise ValueError("No generator is specified")
 
-        return random.uniform(low, high)
+        return low + (high - low) * self._rand()
 
     def randint(self, low: int, high: int) -> int:
         if self._generator is None:
             raise ValueError("No generator is specified")
 
-        return random.randint(low, high)
+        return self._randrange(low, high + 1)
 
     def choice(self, seq: Sequence) -> any:
         if not seq:
@@ -44,10 +50,10 @@ class MersenneTwister(PseudoRandomNumberGenerator):
         if self._generator is None:
             raise ValueError("No generator is specified")
 
-        return random.choice(seq)
+        return self._rng.choice(seq)
 
     def shuffle(self, seq: Sequence) -> None:
         if self._generator is None:
             raise ValueError("No generator is specified")
 
-        random.shuffle(seq)
+        self._rng.shuffle(seq)
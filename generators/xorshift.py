@@ -1,45 +1,144 @@
 from typing import Sequence
+
+import numpy as np
+
 from pseudorandom import PseudoRandomNumberGenerator
 
+try:
+    from generators._avx2 import fill_xorshift as _fill_kernel
+except ImportError:  # AVX2 kernels are not built or not supported
+    try:
+        from generators._xorshift_kernel import fill as _fill_kernel
+    except ImportError:  # Numba is not installed
+        _fill_kernel = None
+
 
 __all__ = ["XORShift"]
 
+_UINT32_MASK = 0xFFFFFFFF
+_INV_UINT32 = 1.0 / (1 << 32)
+
 
 class XORShift(PseudoRandomNumberGenerator):
-    """XORShift32 algorithm implementation."""
+    """
+    XORShift32 algorithm implementation.
+
+    Runs `_LANES` independent XORShift32 states side by side,
+    so that every step produces `_LANES` numbers at once.
+    """
+
+    # Number of independent states stepped together
+    _LANES = 8
+    # Added to the seed before seeding each lane to diverge the lanes
+    _INCREMENT = 0x9E3779B9
+    # Amount of numbers generated per buffer refill
+    _BUFFER_SIZE = 16384
 
     def __init__(self):
         self._seed = None
-        self._generator = None
+        self._state = None
+        self._buffer = []
+        self._index = 0
 
     def seed(self, seed_value: int):
-        self._seed = seed_value
-        self._generator = self.random()
+        self._seed = np.uint32(seed_value & _UINT32_MASK)
+        self._state = np.empty(self._LANES, dtype=np.uint32)
+        for lane in range(self._LANES):
+            # Unlike `+`, the ufunc wraps around without overflow warnings
+            self._seed = np.add(self._seed, np.uint32(self._INCREMENT))
+            self._xorshift()
+            # A zero state would keep producing zeros
+            self._state[lane] = self._seed or self._INCREMENT
+
+        self._buffer = []
+        self._index = 0
 
     def _xorshift(self):
-        self._seed ^= self._seed << 13
-        self._seed ^= self._seed >> 17
-        self._seed ^= self._seed << 5
-        return (self._seed % self.uint32_t) / self.uint32_t
+        # uint32 shifts drop the overflowing bits by themselves
+        self._seed ^= self._seed << np.uint32(13)
+        self._seed ^= self._seed >> np.uint32(17)
+        self._seed ^= self._seed << np.uint32(5)
+        return self._seed * _INV_UINT32
+
+    def _step(self):
+        """Advance all lanes by one XORShift32 step."""
+        state = self._state
+        state ^= state << np.uint32(13)
+        state ^= state >> np.uint32(17)
+        state ^= state << np.uint32(5)
+
+    def _fill(self, n: int) -> np.ndarray:
+        """
+        Generate the next `n` numbers of the sequence at once.
+
+        Each row holds one step of all lanes, rows are flattened in order.
+        """
+        rows = -(-n // self._LANES)
+
+        if _fill_kernel is None:
+            states = np.empty((rows, self._LANES), dtype=np.uint32)
+            for row in range(rows):
+                self._step()
+                states[row] = self._state
+        else:
+            states = _fill_kernel(self._state, rows)
+
+        return states.ravel()[:n] * _INV_UINT32
+
+    def _next(self) -> float:
+        if self._index == len(self._buffer):
+            self._buffer = self._fill(self._BUFFER_SIZE).tolist()
+            self._index = 0
+
+        number = self._buffer[self._index]
+        self._index += 1
+        return number
+
+    def random(self) -> "XORShift":
+        if self._seed is None:
+            raise ValueError("No seed provided")
+
+        return self
 
-    def random(self):
+    def __iter__(self) -> "XORShift":
+        return self
+
+    def __next__(self) -> float:
         if self._seed is None:
             raise ValueError("No seed provided")
 
-        while True:
-            yield self._xorshift()
+        return self._next()
 
     def uniform(self, low: float = 0.0, high: float = 1.0):
-        if self._generator is None:
+        if self._seed is None:
             raise ValueError("No generator available")
 
-        return low + (high - low) * next(self._generator)
+        return low + (high - low) * self._next()
+
+    def random_array(self, n: int) -> np.ndarray:
+        if self._seed is None:
+            raise ValueError("No generator available")
+
+        numbers = np.empty(n, dtype=np.float64)
+        buffered = self._buffer[self._index : self._index + n]
+        numbers[: len(buffered)] = buffered
+        self._index += len(buffered)
+
+        remaining = n - len(buffered)
+        if remaining:
+            # Fill whole rows of lanes, keeping the surplus for later calls
+            filled = self._fill(-(-remaining // self._LANES) * self._LANES)
+            numbers[len(buffered) :] = filled[:remaining]
+            self._buffer = filled[remaining:].tolist()
+            self._index = 0
+
+        return numbers
 
     def randint(self, low: int, high: int):
-        if self._generator is None:
+        if self._seed is None:
             raise ValueError("No generator available")
 
-        return int(low + (high - low + 1) * next(self._generator))
+        return int(low + (high - low + 1) * self._next())
 
     def choice(self, seq: Sequence):
         if len(seq) == 0:
@@ -49,6 +148,12 @@ class XORShift(PseudoRandomNumberGenerator):
         return seq[index]
 
     def shuffle(self, seq: Sequence):
-        for i in range(len(seq) - 1, 0, -1):
-            j = self.randint(0, i)
+        n = len(seq)
+        if n < 2:
+            return
+
+        # Swap positions for i = n - 1, ..., 1, same as randint(0, i)
+        positions = self.random_array(n - 1) * np.arange(n, 1, -1)
+        positions = positions.astype(np.int64).tolist()
+        for i, j in zip(range(n - 1, 0, -1), positions):
             seq[i], seq[j] = seq[j], seq[i]
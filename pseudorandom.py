@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Generator, Sequence
+from typing import Iterator, Sequence
+
+import numpy as np
 
 
 class PseudoRandomNumberGenerator(ABC):
@@ -17,9 +19,9 @@ class PseudoRandomNumberGenerator(ABC):
         pass
 
     @abstractmethod
-    def random(self) -> Generator[int, None, None]:
+    def random(self) -> Iterator:
         """
-        Return the generator object.
+        Return an iterator over the generated numbers.
 
         :throws: ValueError if no seed is provided
         """
@@ -35,6 +37,17 @@ class PseudoRandomNumberGenerator(ABC):
         """
         pass
 
+    def random_array(self, n: int) -> np.ndarray:
+        """
+        Return an array of `n` random floating point numbers
+        in the range [0.0, 1.0).
+
+        :throws: ValueError if no generator is specified
+        """
+        return np.fromiter(
+            (self.uniform() for _ in range(n)), dtype=np.float64, count=n
+        )
+
     @abstractmethod
     def randint(self, low: int, high: int) -> int:
         """
@@ -1,15 +1,27 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.stats import chi2, kstest
+from scipy.stats import chi2, kstest, norm
 
 import generators
 from pseudorandom import PseudoRandomNumberGenerator
 
 
+@lru_cache(maxsize=32)
+def _chi_square_critical_value(bins: int) -> float:
+    """Return the chi-square critical value at 0.95 for `bins` bins."""
+    return chi2.ppf(0.95, bins - 1)
+
+
 @dataclass
 class ChiSquareResult:
     consistent: bool
@@ -35,16 +47,21 @@ class PseudoRandomTests:
         seed: int,
         amount: int,
         output_path: str,
-    ) -> list[float]:
+        chunk_size: int = 65536,
+    ) -> np.ndarray:
         path = Path(output_path)
         generator = generator_class()
         generator.seed(seed)
 
-        numbers = [generator.uniform() for _ in range(amount)]
+        numbers = np.empty(amount, dtype=np.float64)
 
         path.parent.mkdir(exist_ok=True)
+        # Generate and write by chunks, so temporary buffers stay bounded
         with open(output_path, "w") as output_file:
-            output_file.write("\n".join([str(number) for number in numbers]))
+            for start in range(0, amount, chunk_size):
+                chunk = numbers[start : start + chunk_size]
+                chunk[:] = generator.random_array(len(chunk))
+                np.savetxt(output_file, chunk, fmt="%.17g")
 
         return numbers
 
@@ -72,13 +89,17 @@ class PseudoRandomTests:
         bins = len(samples) // 100
 
         expected_frequency = len(samples) / bins
-        observed_frequency, _ = np.histogram(samples, bins=bins)
-
-        chi_square = np.sum(
-            (observed_frequency - expected_frequency) ** 2 / expected_frequency
-        )
-        critical_value = chi2.ppf(0.95, bins - 1)
-        p_value = 1 - chi2.cdf(chi_square, bins - 1)
+        # Samples are in [0, 1], so bin indices follow from scaling them
+        indices = (np.asarray(samples) * bins).astype(np.int64)
+        # A sample of exactly 1.0 belongs to the last bin
+        indices[indices == bins] = bins - 1
+        observed_frequency = np.bincount(indices, minlength=bins)
+
+        # Expected frequency is the same for every bin, so divide once
+        deviation = observed_frequency - expected_frequency
+        chi_square = deviation.dot(deviation) / expected_frequency
+        critical_value = _chi_square_critical_value(bins)
+        p_value = chi2.sf(chi_square, bins - 1)
 
         return ChiSquareResult(
             chi_square <= critical_value,
@@ -116,20 +137,16 @@ class PseudoRandomTests:
         return KolmogorovSmirnovResult(p_value > 0.05, statistic, p_value)
 
     def plot_p_values(
-        self, test_names: list[str], p_values: list[float], save_path: str
+        self, ax: plt.Axes, test_names: list[str], p_values: list[float]
     ):
         """
-        Creates a bar chart to visualize the p-values
-        and saves it as an image file.
+        Draws a bar chart to visualize the p-values on the given axes.
 
+        :param ax: The axes to draw on.
         :param test_names: A list of test names.
         :param p_values: A list of p-values.
-        :param save_path: The file path to save the chart.
         """
 
-        # Set up the figure and axes
-        fig, ax = plt.subplots()
-
         # Create the bar chart for p-values
         x = range(len(test_names))
         width = 0.35
@@ -142,29 +159,21 @@ class PseudoRandomTests:
         ax.set_xticks(x)
         ax.set_xticklabels(test_names)
 
-        path = Path(save_path)
-        path.parent.mkdir(exist_ok=True)
-
-        plt.savefig(save_path)
-
     def plot_chi_square_values(
         self,
+        ax: plt.Axes,
         test_names: list[str],
         chi_square_values: list[float],
-        save_path: str,
     ):
         """
-        Creates a bar chart to visualize the chi-square values and
-        saves it as an image file.
+        Draws a bar chart to visualize the chi-square values
+        on the given axes.
 
+        :param ax: The axes to draw on.
         :param test_names: A list of test names.
         :param chi_square_values: A list of chi-square values.
-        :param save_path: The file path to save the chart.
         """
 
-        # Set up the figure and axes
-        fig, ax = plt.subplots()
-
         # Create the bar chart for chi-square values
         x = range(len(test_names))
         width = 0.35
@@ -177,48 +186,36 @@ class PseudoRandomTests:
         ax.set_xticks(x)
         ax.set_xticklabels(test_names)
 
-        path = Path(save_path)
-        path.parent.mkdir(exist_ok=True)
-
-        plt.savefig(save_path)
-
     def plot_number_sequences(
         self,
+        ax: plt.Axes,
         test_names: list[str],
         number_sequences: list[list[float]],
-        save_path: str,
     ):
         """
-        Creates a line plot to visualize the number sequences
-        and saves it as an image file.
+        Draws a line plot to visualize the number sequences
+        on the given axes.
 
+        :param ax: The axes to draw on.
         :param test_names: A list of test names.
         :param number_sequences: A list of number sequences.
-        :param save_path: The file path to save the chart.
         """
 
-        _, ax = plt.subplots()
-
-        for i, numbers in enumerate(number_sequences):
-            mu = np.mean(numbers)
-            sigma = np.std(numbers)
-            x = np.linspace(mu - 3 * sigma, mu + 3 * sigma, 100)
-            y = (1 / (sigma * np.sqrt(2 * np.pi))) * np.exp(
-                -((x - mu) ** 2) / (2 * sigma**2)
-            )
+        # One row per sequence, so all densities are computed at once
+        sequences = np.asarray(number_sequences)
+        mu = sequences.mean(axis=1, keepdims=True)
+        sigma = sequences.std(axis=1, keepdims=True)
+        x = mu + sigma * np.linspace(-3, 3, 100)
+        y = norm.pdf(x, loc=mu, scale=sigma)
 
-            plt.plot(x, y, alpha=0.5, label=test_names[i])
+        for i, name in enumerate(test_names):
+            ax.plot(x[i], y[i], alpha=0.5, label=name)
 
-        plt.xlabel("x")
-        plt.ylabel("Probability density")
-        plt.title("Normal Distribution")
+        ax.set_xlabel("x")
+        ax.set_ylabel("Probability density")
+        ax.set_title("Normal Distribution")
         ax.legend()
 
-        path = Path(save_path)
-        path.parent.mkdir(exist_ok=True)
-
-        plt.savefig(save_path)
-
     def run(self, seed: int = None):
         generators = self._get_generators()
 
@@ -234,12 +231,24 @@ class PseudoRandomTests:
         p_values = []
         sequences = []
 
-        output = f"Seed: {seed}\n\n"
-        for generator in generators:
-            numbers = self.generate(
-                generator, seed, 10000, f"out/{generator.__name__}.txt"
-            )
+        # Independent seed for each generator, so they can run in parallel
+        seed_sequences = np.random.SeedSequence(seed).spawn(len(generators))
+
+        with ProcessPoolExecutor(max_workers=len(generators)) as executor:
+            futures = [
+                executor.submit(
+                    self.generate,
+                    generator,
+                    int(seed_sequence.generate_state(1)[0]),
+                    10000,
+                    f"out/{generator.__name__}.txt",
+                )
+                for generator, seed_sequence in zip(generators, seed_sequences)
+            ]
+            results = [future.result() for future in futures]
 
+        output = f"Seed: {seed}\n\n"
+        for generator, numbers in zip(generators, results):
             chi_test = self.chi_square_uniformity_test(numbers)
             ks_test = self.kolmogorov_smirnov_test(numbers)
 
@@ -272,11 +281,24 @@ class PseudoRandomTests:
         with open("out/test.txt", "w") as out:
             out.write(output)
 
-        self.plot_p_values(names, p_values, "out/p_values.png")
-        self.plot_chi_square_values(
-            names, chi_square_values, "out/chi_values.png"
-        )
-        self.plot_number_sequences(names, sequences, "out/numbers.png")
-
-
-PseudoRandomTests().run()
+        # Reuse one figure for all charts instead of creating one per chart
+        fig, ax = plt.subplots()
+        charts = [
+            (self.plot_p_values, p_values, "out/p_values.png"),
+            (
+                self.plot_chi_square_values,
+                chi_square_values,
+                "out/chi_values.png",
+            ),
+            (self.plot_number_sequences, sequences, "out/numbers.png"),
+        ]
+        for plot, values, save_path in charts:
+            ax.clear()
+            plot(ax, names, values)
+            fig.savefig(save_path)
+
+        plt.close(fig)
+
+
+if __name__ == "__main__":
+    PseudoRandomTests().run()